@@ -1,7 +1,10 @@
 from .api import (
     ZabbixAPI,
+    ZabbixAPIBatch,
     ZabbixAPIException,
     ZabbixAPIMethod,
     ZabbixAPIObject,
     ZabbixAPIObjectClass,
+    ZabbixAPIPipeline,
+    ZabbixAPIPipelineStep,
 )
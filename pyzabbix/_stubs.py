@@ -0,0 +1,68 @@
+"""Methods of the well known Zabbix API objects.
+
+pyzabbix.api generates a subclass of ZabbixAPIObject for each object, so
+calls like ``zapi.host.get()`` do not go through ``__getattr__``. Other
+methods and objects are still resolved dynamically.
+"""
+
+from typing import Dict, Tuple
+
+COMMON_METHODS = ("get", "create", "update", "delete")
+
+# Object names, with the methods that differ from COMMON_METHODS
+OBJECTS: Dict[str, Tuple[str, ...]] = {
+    "action": COMMON_METHODS,
+    "alert": ("get",),
+    "apiinfo": ("version",),
+    "auditlog": ("get",),
+    "authentication": ("get", "update"),
+    "autoregistration": ("get", "update"),
+    "configuration": ("export", "importcompare"),
+    "correlation": COMMON_METHODS,
+    "dashboard": COMMON_METHODS,
+    "dcheck": ("get",),
+    "dhost": ("get",),
+    "discoveryrule": COMMON_METHODS + ("copy",),
+    "drule": COMMON_METHODS,
+    "dservice": ("get",),
+    "event": ("get", "acknowledge"),
+    "graph": COMMON_METHODS,
+    "graphitem": ("get",),
+    "graphprototype": COMMON_METHODS,
+    "hanode": ("get",),
+    "history": ("get", "clear"),
+    "host": COMMON_METHODS + ("massadd", "massremove", "massupdate"),
+    "hostgroup": COMMON_METHODS + ("massadd", "massremove", "massupdate"),
+    "hostinterface": COMMON_METHODS,
+    "hostprototype": COMMON_METHODS,
+    "housekeeping": ("get", "update"),
+    "httptest": COMMON_METHODS,
+    "iconmap": COMMON_METHODS,
+    "image": COMMON_METHODS,
+    "item": COMMON_METHODS,
+    "itemprototype": COMMON_METHODS,
+    "maintenance": COMMON_METHODS,
+    "map": COMMON_METHODS,
+    "mediatype": COMMON_METHODS,
+    "problem": ("get",),
+    "proxy": COMMON_METHODS,
+    "regexp": COMMON_METHODS,
+    "report": COMMON_METHODS,
+    "role": COMMON_METHODS,
+    "script": COMMON_METHODS + ("execute", "getscriptsbyhosts"),
+    "service": COMMON_METHODS,
+    "settings": ("get", "update"),
+    "sla": COMMON_METHODS + ("getsli",),
+    "task": ("get", "create"),
+    "template": COMMON_METHODS + ("massadd", "massremove", "massupdate"),
+    "templatedashboard": COMMON_METHODS,
+    "templategroup": COMMON_METHODS + ("massadd", "massremove", "massupdate"),
+    "token": COMMON_METHODS + ("generate",),
+    "trend": ("get",),
+    "trigger": COMMON_METHODS,
+    "triggerprototype": COMMON_METHODS,
+    "user": COMMON_METHODS + ("login", "logout", "checkAuthentication"),
+    "usergroup": COMMON_METHODS,
+    "usermacro": COMMON_METHODS,
+    "valuemap": COMMON_METHODS,
+}
@@ -0,0 +1,233 @@
+# pylint: disable=wrong-import-order
+
+import logging
+from importlib.util import find_spec
+from typing import Dict, Optional, Union
+
+import httpx
+from packaging.version import Version
+
+from .api import (
+    _VERSION_CACHE,
+    DEFAULT_HEADERS,
+    ZABBIX_5_4_0,
+    Params,
+    ZabbixAPIException,
+    _BaseZabbixAPI,
+    _json_dumps,
+    _normalize_url,
+    _parse_response,
+    _raise_for_error,
+)
+
+__all__ = [
+    "AsyncZabbixAPI",
+    "AsyncZabbixAPIMethod",
+    "AsyncZabbixAPIObject",
+]
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# HTTP/2 requires the optional h2 package
+HTTP2 = find_spec("h2") is not None
+
+
+# pylint: disable=too-many-instance-attributes
+class AsyncZabbixAPI(_BaseZabbixAPI):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        server: str = "http://localhost/zabbix",
+        client: Optional[httpx.AsyncClient] = None,
+        use_authenticate: bool = False,
+        timeout: Optional[Union[float, int, httpx.Timeout]] = None,
+        detect_version: bool = True,
+    ):
+        """
+        :param server: Base URI for zabbix web interface (omitting /api_jsonrpc.php)
+        :param client: optional pre-configured httpx.AsyncClient instance
+        :param use_authenticate: Use old (Zabbix 1.8) style authentication
+        :param timeout: optional timeout in seconds, default: None
+                        It is applied to each request, so it also overrides the
+                        timeout of a provided client.
+        :param detect_version: autodetect Zabbix API version
+        """
+        self._own_client = client is None
+        self.client = client or httpx.AsyncClient(
+            http2=HTTP2,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        )
+
+        # Default headers for all requests
+        self.client.headers.update(DEFAULT_HEADERS)
+
+        self.timeout = timeout
+
+        self.use_authenticate = use_authenticate
+        self.use_api_token = False
+        self.auth = ""
+        self.id = 0
+
+        self.url = _normalize_url(server)
+        logger.info("JSON-RPC Server Endpoint: %s", self.url)
+
+        self.version: Optional[Version] = None
+        self._detect_version = detect_version
+
+        self._object_cache: Dict[str, AsyncZabbixAPIObject] = {}
+
+    async def __aenter__(self) -> "AsyncZabbixAPI":
+        return self
+
+    # pylint: disable=inconsistent-return-statements
+    async def __aexit__(self, exception_type, exception_value, traceback):
+        try:
+            if isinstance(exception_value, (ZabbixAPIException, type(None))):
+                if not self.use_api_token and await self.is_authenticated():
+                    # Logout the user if they are authenticated using username + password.
+                    await self.user.logout()
+                return True
+            return None
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client, unless it was provided by the caller."""
+        if self._own_client:
+            await self.client.aclose()
+
+    async def login(
+        self,
+        user: str = "",
+        password: str = "",
+        api_token: Optional[str] = None,
+    ) -> None:
+        """Convenience method for calling user.authenticate
+        and storing the resulting auth token for further commands.
+
+        If use_authenticate is set, it uses the older (Zabbix 1.8)
+        authentication command
+
+        :param password: Password used to login into Zabbix
+        :param user: Username used to login into Zabbix
+        :param api_token: API Token to authenticate with
+        """
+
+        if self._detect_version:
+            self.version = _VERSION_CACHE.get(self.url)
+            if self.version is None:
+                self.version = Version(await self.api_version())
+                _VERSION_CACHE[self.url] = self.version
+            logger.info("Zabbix API version is: %s", self.version)
+
+        # If the API token is explicitly provided, use this instead.
+        if self._use_api_token(api_token):
+            return
+
+        # If we have an invalid auth token, we are not allowed to send a login
+        # request. Clear it before trying.
+        self.auth = ""
+        if self.use_authenticate:
+            self.auth = await self.user.authenticate(user=user, password=password)
+        elif self.version and self.version >= ZABBIX_5_4_0:
+            self.auth = await self.user.login(username=user, password=password)
+        else:
+            self.auth = await self.user.login(user=user, password=password)
+
+    async def is_authenticated(self) -> bool:
+        if self.use_api_token:
+            # We cannot use this call using an API Token
+            return True
+
+        try:
+            await self.user.checkAuthentication(sessionid=self.auth)
+        except ZabbixAPIException:
+            return False
+        return True
+
+    async def api_version(self) -> str:
+        return await self.apiinfo.version()
+
+    async def do_request(
+        self,
+        method: str,
+        params: Params = None,
+    ) -> dict:
+        payload, headers = self._build_request(method, params)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending: %s", payload)
+        resp = await self.client.post(
+            self.url,
+            content=_json_dumps(payload),
+            headers=headers,
+            timeout=(
+                httpx.USE_CLIENT_DEFAULT if self.timeout is None else self.timeout
+            ),
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response Code: %s", resp.status_code)
+
+        # NOTE: Getting a 412 response code means the headers are not in the
+        # list of allowed headers.
+        resp.raise_for_status()
+
+        response = _parse_response(resp.content)
+        _raise_for_error(response)
+
+        return response
+
+    def _object(self, attr: str) -> "AsyncZabbixAPIObject":
+        """Dynamically create an object class (ie: host)"""
+        obj = self._object_cache.get(attr)
+        if obj is None:
+            obj = self._object_cache.setdefault(attr, AsyncZabbixAPIObject(attr, self))
+        return obj
+
+    def __getattr__(self, attr: str) -> "AsyncZabbixAPIObject":
+        return self._object(attr)
+
+    def __getitem__(self, attr: str) -> "AsyncZabbixAPIObject":
+        return self._object(attr)
+
+
+# pylint: disable=too-few-public-methods
+class AsyncZabbixAPIMethod:
+    __slots__ = ("_method", "_parent")
+
+    def __init__(self, method: str, parent: AsyncZabbixAPI):
+        self._method = method
+        self._parent = parent
+
+    async def __call__(self, *args, **kwargs):
+        if args and kwargs:
+            raise TypeError("Found both args and kwargs")
+
+        return (await self._parent.do_request(self._method, args or kwargs))["result"]
+
+
+# pylint: disable=too-few-public-methods
+class AsyncZabbixAPIObject:
+    __slots__ = ("_name", "_parent", "_method_cache")
+
+    def __init__(self, name: str, parent: AsyncZabbixAPI):
+        self._name = name
+        self._parent = parent
+        self._method_cache: Dict[str, AsyncZabbixAPIMethod] = {}
+
+    def _method(self, attr: str) -> AsyncZabbixAPIMethod:
+        """Dynamically create a method (ie: get)"""
+        method = self._method_cache.get(attr)
+        if method is None:
+            method = self._method_cache.setdefault(
+                attr, AsyncZabbixAPIMethod(f"{self._name}.{attr}", self._parent)
+            )
+        return method
+
+    def __getattr__(self, attr: str) -> AsyncZabbixAPIMethod:
+        return self._method(attr)
+
+    def __getitem__(self, attr: str) -> AsyncZabbixAPIMethod:
+        return self._method(attr)
@@ -1,18 +1,56 @@
 # pylint: disable=wrong-import-order
 
+import hashlib
+import itertools
+import json
 import logging
-from typing import Mapping, Optional, Sequence, Tuple, Union
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 from warnings import warn
 
 from packaging.version import Version
 from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ._stubs import OBJECTS
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
 
 __all__ = [
     "ZabbixAPI",
+    "ZabbixAPIBatch",
     "ZabbixAPIException",
     "ZabbixAPIMethod",
     "ZabbixAPIObject",
     "ZabbixAPIObjectClass",
+    "ZabbixAPIPipeline",
+    "ZabbixAPIPipelineStep",
 ]
 
 logger = logging.getLogger(__name__)
@@ -21,6 +59,30 @@ logger.addHandler(logging.NullHandler())
 ZABBIX_5_4_0 = Version("5.4.0")
 ZABBIX_6_4_0 = Version("6.4.0")
 
+Params = Optional[Union[Mapping, Sequence]]
+
+DEFAULT_HEADERS = {
+    "Content-Type": "application/json-rpc",
+    "User-Agent": "python/pyzabbix",
+    "Cache-Control": "no-cache",
+}
+
+# We don't have to pass the auth token if asking for
+# the apiinfo.version or user.checkAuthentication
+_NO_AUTH_METHODS = frozenset(
+    {
+        "apiinfo.version",
+        "user.checkAuthentication",
+        "user.login",
+    }
+)
+
+# Only warn on the first call of the deprecated ZabbixAPI.confimport
+_CONFIMPORT_WARNED = False
+
+# Detected API versions, by server URL
+_VERSION_CACHE: Dict[str, Version] = {}
+
 
 class ZabbixAPIException(Exception):
     """Generic Zabbix API exception
@@ -43,9 +105,156 @@ class ZabbixAPIException(Exception):
         self.error = kwargs.get("error", None)
 
 
+def _json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _iter_json_items(
+    events: Iterable[Tuple[str, str, Any]],
+    prefixes: Sequence[str],
+) -> Iterator[Tuple[str, Any]]:
+    """Build the values found at the given prefixes from ijson parser events.
+
+    When an array is found at a prefix whose items are also wanted (e.g.
+    "result" and "result.item"), the items are yielded instead of the array.
+    """
+    builder = None
+    current = ""
+    for prefix, event, value in events:
+        if builder is None:
+            if prefix not in prefixes:
+                continue
+            if event in ("start_array", "end_array") and f"{prefix}.item" in prefixes:
+                continue
+            if event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()  # type: ignore[union-attr]
+                builder.event(event, value)
+                current = prefix
+            else:
+                yield prefix, value
+        else:
+            builder.event(event, value)
+            if prefix == current and event in ("end_map", "end_array"):
+                yield current, builder.value
+                builder = None
+
+
+@lru_cache(maxsize=64)
+def _normalize_url(server: str) -> str:
+    if not server.endswith("/api_jsonrpc.php"):
+        server = server.rstrip("/") + "/api_jsonrpc.php"
+    return server
+
+
+def _parse_response(content: bytes) -> Any:
+    if not content:
+        raise ZabbixAPIException("Received empty response")
+
+    try:
+        # orjson.JSONDecodeError is a subclass of ValueError
+        response = _json_loads(content)
+    except ValueError as exception:
+        text = content.decode("utf-8", "replace")
+        raise ZabbixAPIException(f"Unable to parse json: {text}") from exception
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Response Body: %s", response)
+
+    return response
+
+
+def _raise_for_error(response: dict) -> None:
+    error = response.get("error")
+    if error is not None:  # some exception
+        # some errors don't contain 'data': workaround for ZBX-9340
+        error.setdefault("data", "No data")
+
+        raise ZabbixAPIException(
+            f"Error {error['code']}: {error['message']}, {error['data']}",
+            error["code"],
+            error=error,
+        )
+
+
+def _build_payload(method: str, params: Params, request_id: int) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "method": method,
+        "params": params or {},
+        "id": request_id,
+    }
+
+
+def _apply_auth(
+    auth: str,
+    version: Optional[Version],
+    method: str,
+    payload: dict,
+    headers: dict,
+) -> None:
+    # The auth token is read on each request: it must follow changes of
+    # ZabbixAPI.auth and not leak into a session shared with other servers
+    if auth and method not in _NO_AUTH_METHODS:
+        if version and version >= ZABBIX_6_4_0:
+            headers["Authorization"] = f"Bearer {auth}"
+        else:
+            payload["auth"] = auth
+
+
+# pylint: disable=too-few-public-methods
+class _BaseZabbixAPI:
+    """Request building shared by the sync and async clients"""
+
+    auth: str
+    use_api_token: bool
+    version: Optional[Version]
+    _ids: Iterator[int]
+    _last_id: int
+
+    @property
+    def id(self) -> int:  # pylint: disable=invalid-name
+        """Id of the next request"""
+        return self._last_id + 1
+
+    @id.setter
+    def id(self, value: int) -> None:
+        self._ids = itertools.count(value)
+        self._last_id = value - 1
+
+    def _next_id(self) -> int:
+        # next() on itertools.count is atomic, requests sent from several
+        # threads get distinct ids
+        request_id = next(self._ids)
+        self._last_id = request_id
+        return request_id
+
+    def _build_request(self, method: str, params: Params) -> Tuple[dict, dict]:
+        """Build the payload and headers of a request"""
+        payload = _build_payload(method, params, self._next_id())
+        headers: dict = {}
+        _apply_auth(self.auth, self.version, method, payload, headers)
+        return payload, headers
+
+    def _use_api_token(self, api_token: Optional[str]) -> bool:
+        """Use the API token instead of a user session, if it is provided"""
+        if api_token is None:
+            return False
+        self.use_api_token = True
+        self.auth = api_token
+        return True
+
+
 # pylint: disable=too-many-instance-attributes
-class ZabbixAPI:
-    # pylint: disable=too-many-arguments
+class ZabbixAPI(_BaseZabbixAPI):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(
         self,
         server: str = "http://localhost/zabbix",
@@ -53,6 +262,8 @@ class ZabbixAPI:
         use_authenticate: bool = False,
         timeout: Optional[Union[float, int, Tuple[int, int]]] = None,
         detect_version: bool = True,
+        token_cache_path: Optional[str] = None,
+        pool_maxsize: Optional[int] = None,
     ):
         """
         :param server: Base URI for zabbix web interface (omitting /api_jsonrpc.php)
@@ -63,42 +274,86 @@ class ZabbixAPI:
                         tuple: "(connect, read)" which is used to set individual
                         connect and read timeouts.
         :param detect_version: autodetect Zabbix API version
+        :param token_cache_path: optional directory (e.g. "~/.cache/pyzabbix") where
+                                 the session tokens are stored, to be reused by
+                                 later logins instead of calling user.login
+        :param pool_maxsize: maximum number of connections kept in the pool, only
+                             used when no session is provided, default: 32 or
+                             the PYZABBIX_POOL_MAXSIZE environment variable
         """
-        self.session = session or Session()
+        if pool_maxsize is None:
+            pool_maxsize = int(os.environ.get("PYZABBIX_POOL_MAXSIZE", 32))
+        self.pool_maxsize = pool_maxsize
+
+        self._own_session = session is None
+        if session is None:
+            session = Session()
+            self._mount_adapter(session, pool_maxsize)
+        self.session = session
 
         # Default headers for all requests
-        self.session.headers.update(
-            {
-                "Content-Type": "application/json-rpc",
-                "User-Agent": "python/pyzabbix",
-                "Cache-Control": "no-cache",
-            }
-        )
+        self.session.headers.update(DEFAULT_HEADERS)
 
         self.use_authenticate = use_authenticate
         self.use_api_token = False
         self.auth = ""
-        self.id = 0  # pylint: disable=invalid-name
+        self.id = 0
 
         self.timeout = timeout
 
-        if not server.endswith("/api_jsonrpc.php"):
-            server = server.rstrip("/") + "/api_jsonrpc.php"
-        self.url = server
+        self.url = _normalize_url(server)
         logger.info("JSON-RPC Server Endpoint: %s", self.url)
 
         self.version: Optional[Version] = None
         self._detect_version = detect_version
 
+        self._object_cache: Dict[str, ZabbixAPIObject] = {}
+
+        self.token_cache_path = token_cache_path
+        self._token_cache_file: Optional[str] = None
+
+        # Seconds during which a successful is_authenticated check is reused
+        self.auth_check_ttl = 60.0
+        # Token and time of the last successful check, None if never checked
+        self._auth_checked: Optional[Tuple[str, float]] = None
+
+    @staticmethod
+    def _mount_adapter(session: Session, pool_maxsize: int) -> None:
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_maxsize,
+            pool_block=False,
+            # Only retry when the request was not processed: non-idempotent
+            # calls (e.g. host.create) must not run twice
+            max_retries=Retry(
+                total=3,
+                read=0,
+                backoff_factor=0.2,
+                status_forcelist=(503,),
+                allowed_methods=frozenset({"POST"}),
+                # Maintenance pages may ask to come back hours later, the
+                # request timeout does not apply to that sleep
+                respect_retry_after_header=False,
+                # Let raise_for_status() report the last response
+                raise_on_status=False,
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
     def __enter__(self) -> "ZabbixAPI":
         return self
 
     # pylint: disable=inconsistent-return-statements
     def __exit__(self, exception_type, exception_value, traceback):
         if isinstance(exception_value, (ZabbixAPIException, type(None))):
+            # Do not trust a cached check, the session may have expired since
+            self._auth_checked = None
             if self.is_authenticated and not self.use_api_token:
                 # Logout the user if they are authenticated using username + password.
                 self.user.logout()
+                self._auth_checked = None
+                self._remove_cached_token()
             return True
         return None
 
@@ -118,17 +373,27 @@ class ZabbixAPI:
         :param user: Username used to login into Zabbix
         :param api_token: API Token to authenticate with
         """
+        self._auth_checked = None
 
         if self._detect_version:
-            self.version = Version(self.api_version())
+            self.version = _VERSION_CACHE.get(self.url)
+            if self.version is None:
+                self.version = Version(self.api_version())
+                _VERSION_CACHE[self.url] = self.version
             logger.info("Zabbix API version is: %s", self.version)
 
         # If the API token is explicitly provided, use this instead.
-        if api_token is not None:
-            self.use_api_token = True
-            self.auth = api_token
+        if self._use_api_token(api_token):
             return
 
+        if self.token_cache_path is not None:
+            key = hashlib.sha256(f"{self.url}|{user}".encode()).hexdigest()
+            self._token_cache_file = os.path.join(
+                os.path.expanduser(self.token_cache_path), key
+            )
+            if self._load_cached_token():
+                return
+
         # If we have an invalid auth token, we are not allowed to send a login
         # request. Clear it before trying.
         self.auth = ""
@@ -139,6 +404,59 @@ class ZabbixAPI:
         else:
             self.auth = self.user.login(user=user, password=password)
 
+        self._store_cached_token()
+
+    def _load_cached_token(self) -> bool:
+        """Reuse the cached session token, if it is still valid."""
+        if self._token_cache_file is None:
+            return False
+
+        try:
+            with open(self._token_cache_file, encoding="utf-8") as file:
+                self.auth = file.read().strip()
+        except OSError:
+            return False
+
+        try:
+            self.user.checkAuthentication(sessionid=self.auth)
+        except ZabbixAPIException:
+            logger.info("Cached session token is no longer valid")
+            self.auth = ""
+            return False
+        return True
+
+    def _store_cached_token(self) -> None:
+        if self._token_cache_file is None:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(self._token_cache_file), 0o700, exist_ok=True)
+            fd = os.open(
+                self._token_cache_file,
+                os.O_CREAT | os.O_WRONLY | os.O_TRUNC,
+                0o600,
+            )
+            try:
+                os.write(fd, self.auth.encode())
+            finally:
+                os.close(fd)
+        except OSError as exception:
+            logger.warning("Unable to cache session token: %s", exception)
+
+    def _remove_cached_token(self) -> None:
+        if self._token_cache_file is None:
+            return
+
+        try:
+            os.remove(self._token_cache_file)
+        except OSError:
+            pass
+
+    @staticmethod
+    def clear_version_cache() -> None:
+        """Forget the API versions detected during previous logins."""
+        _VERSION_CACHE.clear()
+
     def check_authentication(self):
         if self.use_api_token:
             # We cannot use this call using an API Token
@@ -152,10 +470,20 @@ class ZabbixAPI:
             # We cannot use this call using an API Token
             return True
 
+        if self._auth_checked is not None:
+            token, checked_at = self._auth_checked
+            # A new token is checked again
+            if (
+                token == self.auth
+                and time.monotonic() - checked_at < self.auth_check_ttl
+            ):
+                return True
+
         try:
             self.user.checkAuthentication(sessionid=self.auth)
         except ZabbixAPIException:
             return False
+        self._auth_checked = (self.auth, time.monotonic())
         return True
 
     def confimport(
@@ -170,12 +498,16 @@ class ZabbixAPI:
         :param source:
         :param confformat:
         """
-        warn(
-            "ZabbixAPI.confimport(format, source, rules) has been deprecated, please use "
-            "ZabbixAPI.configuration['import'](format=format, source=source, rules=rules) instead",
-            DeprecationWarning,
-            2,
-        )
+        global _CONFIMPORT_WARNED  # pylint: disable=global-statement
+        if not _CONFIMPORT_WARNED:
+            warn(
+                "ZabbixAPI.confimport(format, source, rules) has been deprecated, "
+                "please use ZabbixAPI.configuration['import'](format=format, "
+                "source=source, rules=rules) instead",
+                DeprecationWarning,
+                2,
+            )
+            _CONFIMPORT_WARNED = True
 
         return self.configuration["import"](
             format=confformat,
@@ -189,73 +521,262 @@ class ZabbixAPI:
     def do_request(
         self,
         method: str,
-        params: Optional[Union[Mapping, Sequence]] = None,
+        params: Params = None,
     ) -> dict:
-        payload = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params or {},
-            "id": self.id,
-        }
-        headers = {}
-
-        # We don't have to pass the auth token if asking for
-        # the apiinfo.version or user.checkAuthentication
-        anonymous_methods = {
-            "apiinfo.version",
-            "user.checkAuthentication",
-            "user.login",
-        }
-        if self.auth and method not in anonymous_methods:
-            if self.version and self.version >= ZABBIX_6_4_0:
-                headers["Authorization"] = f"Bearer {self.auth}"
-            else:
-                payload["auth"] = self.auth
+        payload, headers = self._build_request(method, params)
+
+        response = self._post(payload, headers)
+
+        try:
+            _raise_for_error(response)
+        except ZabbixAPIException as exception:
+            # The session may have expired, check it again next time
+            if exception.error["code"] in (-32602, -32500):
+                self._auth_checked = None
+            raise
 
-        logger.debug("Sending: %s", payload)
+        return response
+
+    def do_request_stream(
+        self,
+        method: str,
+        params: Params = None,
+        item_prefix: str = "result.item",
+    ) -> Iterator[Any]:
+        """Send a request and incrementally parse the response items.
+
+        The response body is streamed, so large results (e.g. history.get)
+        are never fully loaded in memory. Requires the ijson package.
+
+        :param item_prefix: ijson prefix of the items to yield
+        """
+        if ijson is None:
+            raise ImportError("ijson is required to stream responses")
+
+        payload, headers = self._build_request(method, params)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending: %s", payload)
         resp = self.session.post(
             self.url,
-            json=payload,
+            data=_json_dumps(payload),
             headers=headers,
             timeout=self.timeout,
+            stream=True,
         )
-        logger.debug("Response Code: %s", resp.status_code)
+        with closing(resp):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response Code: %s", resp.status_code)
+
+            resp.raise_for_status()
+
+            # Let urllib3 decompress the body
+            resp.raw.decode_content = True
+            events = ijson.parse(resp.raw, use_float=True)
+            # A result that is not an array (e.g. countOutput or *.create) is
+            # yielded as a single value
+            prefixes = (item_prefix, item_prefix.rsplit(".", 1)[0], "error")
+            try:
+                for prefix, value in _iter_json_items(events, prefixes):
+                    if prefix == "error":
+                        _raise_for_error({"error": value})
+                    yield value
+            except ijson.JSONError as exception:
+                raise ZabbixAPIException(
+                    f"Unable to parse json: {exception}"
+                ) from exception
+
+    def do_batch(self, calls: Sequence[Tuple[str, Params]]) -> List[dict]:
+        """Send multiple calls in a single JSON-RPC batch request.
+
+        The responses are returned in the same order as the calls. Errors are
+        not raised, each response may contain an "error" member instead of a
+        "result" member.
+
+        :param calls: sequence of (method, params) tuples
+        """
+        payload = []
+        headers: dict = {}
+        for method, params in calls:
+            request = _build_payload(method, params, self._next_id())
+            _apply_auth(self.auth, self.version, method, request, headers)
+            payload.append(request)
+
+        if not payload:
+            return []
+
+        response = self._post(payload, headers)
+
+        # The whole batch may be rejected with a single error object
+        if isinstance(response, dict):
+            _raise_for_error(response)
+            raise ZabbixAPIException("Received invalid batch response")
+
+        responses = {item.get("id"): item for item in response}
+        for request in payload:
+            if request["id"] not in responses:
+                # Invalid requests are answered with an error and a null id
+                if None in responses:
+                    _raise_for_error(responses[None])
+                raise ZabbixAPIException(
+                    f"Missing response for request id {request['id']}"
+                )
+        return [responses[request["id"]] for request in payload]
+
+    def batch(self) -> "ZabbixAPIBatch":
+        """Queue calls and send them in a single JSON-RPC batch request.
+
+        The calls return a Future, which is resolved when leaving the context:
+
+            with zapi.batch() as batch:
+                hosts = batch.host.get(output=["hostid"])
+                items = batch.item.get(output=["itemid"])
+            print(hosts.result(), items.result())
+        """
+        return ZabbixAPIBatch(self)
+
+    def multicall(
+        self,
+        method: str,
+        params_iter: Iterable[Params],
+        max_workers: Optional[int] = None,
+    ) -> List[Any]:
+        """Call a method once per params, concurrently from a thread pool
+        sharing the session connections.
+
+        The results are returned in the same order as the params. The
+        connection pool does not block: workers beyond its size would open
+        connections that are discarded instead of being reused. With the
+        session created by ZabbixAPI, max_workers can therefore not exceed
+        pool_maxsize. A session provided by the caller must be sized by the
+        caller. Raising max_workers may require raising the number of workers
+        of the Zabbix front-end (web server / PHP-FPM) as well.
+
+        :param method: API method to call (ie: host.get)
+        :param params_iter: params of each call
+        :param max_workers: maximum number of concurrent requests, default: 8
+                            or pool_maxsize if it is smaller
+        """
+        if max_workers is None:
+            max_workers = min(8, self.pool_maxsize) if self._own_session else 8
+        elif self._own_session and max_workers > self.pool_maxsize:
+            raise ValueError(
+                f"max_workers ({max_workers}) is larger than "
+                f"pool_maxsize ({self.pool_maxsize})"
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            responses = executor.map(
+                lambda params: self.do_request(method, params),
+                params_iter,
+            )
+            return [response["result"] for response in responses]
+
+    def pipeline(self) -> "ZabbixAPIPipeline":
+        """Chain dependent calls, independent calls are sent in the same
+        JSON-RPC batch request:
+
+            pipeline = zapi.pipeline()
+            hosts = pipeline.call(
+                "host.get",
+                {"filter": {"host": ["Zabbix server"]}},
+                extract=lambda hosts: [host["hostid"] for host in hosts],
+            )
+            pipeline.call(
+                "item.get",
+                lambda hostid: {"hostids": hostid},
+                after=hosts,
+                fan_out=True,
+            )
+            hostids, items = pipeline.execute()
+        """
+        return ZabbixAPIPipeline(self)
+
+    def _post(self, payload: Union[dict, list], headers: dict) -> Any:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending: %s", payload)
+        resp = self.session.post(
+            self.url,
+            data=_json_dumps(payload),
+            headers=headers,
+            timeout=self.timeout,
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response Code: %s", resp.status_code)
 
         # NOTE: Getting a 412 response code means the headers are not in the
         # list of allowed headers.
         resp.raise_for_status()
 
-        if not resp.text:
-            raise ZabbixAPIException("Received empty response")
+        return _parse_response(resp.content)
 
-        try:
-            response = resp.json()
-        except ValueError as exception:
-            raise ZabbixAPIException(
-                f"Unable to parse json: {resp.text}"
-            ) from exception
+    def _object(self, attr: str) -> "ZabbixAPIObject":
+        """Dynamically create an object class (ie: host)"""
+        obj = self._object_cache.get(attr)
+        if obj is None:
+            obj = self._object_cache.setdefault(
+                attr, _STUBS.get(attr, ZabbixAPIObject)(attr, self)
+            )
+        return obj
 
-        logger.debug("Response Body: %s", response)
+    def __getattr__(self, attr: str) -> "ZabbixAPIObject":
+        obj = self._object(attr)
+        # Later lookups skip __getattr__. It is only reached for missing
+        # attributes, so nothing of the instance or its class is replaced
+        self.__dict__[attr] = obj
+        return obj
 
-        self.id += 1
+    def __getitem__(self, attr: str) -> "ZabbixAPIObject":
+        return self._object(attr)
 
-        if "error" in response:  # some exception
-            error = response["error"]
 
-            # some errors don't contain 'data': workaround for ZBX-9340
-            if "data" not in error:
-                error["data"] = "No data"
+class ZabbixAPIBatch:
+    def __init__(self, parent: ZabbixAPI):
+        self._parent = parent
+        self._calls: List[Tuple[str, Params, Future]] = []
 
-            raise ZabbixAPIException(
-                f"Error {error['code']}: {error['message']}, {error['data']}",
-                error["code"],
-                error=error,
-            )
+    def __enter__(self) -> "ZabbixAPIBatch":
+        return self
 
-        return response
+    def __exit__(self, exception_type, exception_value, traceback):
+        if exception_value is None:
+            self.send()
+        else:
+            for _, _, future in self._calls:
+                future.cancel()
+            self._calls = []
+
+    def queue(
+        self,
+        method: str,
+        params: Params = None,
+    ) -> Future:
+        """Queue a call, the returned Future is resolved by send()"""
+        future: Future = Future()
+        self._calls.append((method, params, future))
+        return future
+
+    def send(self) -> None:
+        """Send the queued calls in a single batch request"""
+        calls, self._calls = self._calls, []
+        try:
+            responses = self._parent.do_batch(
+                [(method, params) for method, params, _ in calls]
+            )
+        except Exception as exception:
+            for _, _, future in calls:
+                future.set_exception(exception)
+            raise
+
+        for (_, _, future), response in zip(calls, responses):
+            try:
+                _raise_for_error(response)
+            except ZabbixAPIException as exception:
+                future.set_exception(exception)
+            else:
+                future.set_result(response["result"])
 
     def _object(self, attr: str) -> "ZabbixAPIObject":
-        """Dynamically create an object class (ie: host)"""
         return ZabbixAPIObject(attr, self)
 
     def __getattr__(self, attr: str) -> "ZabbixAPIObject":
@@ -265,28 +786,153 @@ class ZabbixAPI:
         return self._object(attr)
 
 
+# pylint: disable=too-few-public-methods
+class ZabbixAPIPipelineStep:
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        method: str,
+        params: Union[Params, Callable[..., Params]],
+        extract: Optional[Callable[[Any], Any]],
+        after: Sequence["ZabbixAPIPipelineStep"],
+        fan_out: bool,
+    ):
+        self.method = method
+        self.params = params
+        self.extract = extract
+        self.after = after
+        self.fan_out = fan_out
+        # Steps of the same level are sent in the same batch request
+        self.level: int = max((step.level + 1 for step in after), default=0)
+        self.result: Any = None
+
+    def params_list(self) -> List[Params]:
+        if not callable(self.params):
+            return [self.params]
+
+        results = [step.result for step in self.after]
+        if self.fan_out:
+            return [self.params(value) for value in results[0]]
+        return [self.params(*results)]
+
+
+class ZabbixAPIPipeline:
+    def __init__(self, parent: ZabbixAPI):
+        self._parent = parent
+        self._steps: List[ZabbixAPIPipelineStep] = []
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def call(
+        self,
+        method: str,
+        params: Union[Params, Callable[..., Params]] = None,
+        extract: Optional[Callable[[Any], Any]] = None,
+        after: Optional[
+            Union[ZabbixAPIPipelineStep, Sequence[ZabbixAPIPipelineStep]]
+        ] = None,
+        fan_out: bool = False,
+    ) -> ZabbixAPIPipelineStep:
+        """Add a call to the pipeline.
+
+        :param method: API method to call (ie: host.get)
+        :param params: method params, or a callable building them from the
+                       results of the steps given in 'after'
+        :param extract: optional callable applied to the result of the call
+        :param after: steps this call depends on
+        :param fan_out: call the method once per value of the single step given
+                        in 'after', the result is the list of the results
+        """
+        if after is None:
+            after = []
+        elif isinstance(after, ZabbixAPIPipelineStep):
+            after = [after]
+
+        if fan_out and (len(after) != 1 or not callable(params)):
+            raise ValueError(
+                "fan_out requires a single step in after and callable params"
+            )
+
+        step = ZabbixAPIPipelineStep(method, params, extract, after, fan_out)
+        self._steps.append(step)
+        return step
+
+    def execute(self) -> List[Any]:
+        """Run the calls, one batch request per dependency level, and return
+        the results in the order the calls were added."""
+        for level in sorted({step.level for step in self._steps}):
+            steps = [step for step in self._steps if step.level == level]
+
+            calls: List[Tuple[str, Params]] = []
+            spans = []
+            for step in steps:
+                params_list = step.params_list()
+                spans.append((step, len(calls), len(params_list)))
+                calls.extend((step.method, params) for params in params_list)
+
+            responses = self._parent.do_batch(calls)
+
+            for step, start, count in spans:
+                results = []
+                for response in responses[start : start + count]:
+                    _raise_for_error(response)
+                    results.append(response["result"])
+
+                result = results if step.fan_out else results[0]
+                step.result = step.extract(result) if step.extract else result
+
+        return [step.result for step in self._steps]
+
+
+def _call_method(
+    parent: Union[ZabbixAPI, ZabbixAPIBatch],
+    method: str,
+    args: tuple,
+    kwargs: dict,
+    stream: bool,
+) -> Any:
+    if args and kwargs:
+        raise TypeError("Found both args and kwargs")
+
+    if isinstance(parent, ZabbixAPIBatch):
+        if stream:
+            raise TypeError("Streaming is not supported in batch requests")
+        return parent.queue(method, args or kwargs)
+
+    if stream:
+        return parent.do_request_stream(method, args or kwargs)
+
+    return parent.do_request(method, args or kwargs)["result"]
+
+
 # pylint: disable=too-few-public-methods
 class ZabbixAPIMethod:
-    def __init__(self, method: str, parent: ZabbixAPI):
+    __slots__ = ("_method", "_parent")
+
+    def __init__(self, method: str, parent: Union[ZabbixAPI, ZabbixAPIBatch]):
         self._method = method
         self._parent = parent
 
-    def __call__(self, *args, **kwargs):
-        if args and kwargs:
-            raise TypeError("Found both args and kwargs")
-
-        return self._parent.do_request(self._method, args or kwargs)["result"]
+    def __call__(self, *args: Any, stream: bool = False, **kwargs: Any) -> Any:
+        return _call_method(self._parent, self._method, args, kwargs, stream)
 
 
 # pylint: disable=too-few-public-methods
 class ZabbixAPIObject:
-    def __init__(self, name: str, parent: ZabbixAPI):
+    __slots__ = ("_name", "_parent", "_method_cache")
+
+    def __init__(self, name: str, parent: Union[ZabbixAPI, ZabbixAPIBatch]):
         self._name = name
         self._parent = parent
+        self._method_cache: Dict[str, ZabbixAPIMethod] = {}
 
     def _method(self, attr: str) -> ZabbixAPIMethod:
         """Dynamically create a method (ie: get)"""
-        return ZabbixAPIMethod(f"{self._name}.{attr}", self._parent)
+        method = self._method_cache.get(attr)
+        if method is None:
+            method = self._method_cache.setdefault(
+                attr, ZabbixAPIMethod(f"{self._name}.{attr}", self._parent)
+            )
+        return method
 
     def __getattr__(self, attr: str) -> ZabbixAPIMethod:
         return self._method(attr)
@@ -296,10 +942,47 @@ class ZabbixAPIObject:
 
 
 class ZabbixAPIObjectClass(ZabbixAPIObject):
+    __slots__ = ()
+
+    # Only warn on the first instantiation
+    _warned = False
+
     def __init__(self, *args, **kwargs):
-        warn(
-            "ZabbixAPIObjectClass has been renamed to ZabbixAPIObject",
-            DeprecationWarning,
-            2,
-        )
+        if not type(self)._warned:
+            warn(
+                "ZabbixAPIObjectClass has been renamed to ZabbixAPIObject",
+                DeprecationWarning,
+                2,
+            )
+            type(self)._warned = True
         super().__init__(*args, **kwargs)
+
+
+# pylint: disable=too-few-public-methods
+class _StubMethod:
+    """Method of a well known object, resolved without __getattr__"""
+
+    __slots__ = ("_name",)
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __get__(
+        self, obj: Optional[ZabbixAPIObject], objtype: Any = None
+    ) -> Union["_StubMethod", ZabbixAPIMethod]:
+        if obj is None:
+            return self
+        # The same memoized method as obj[name]
+        return obj._method(self._name)  # pylint: disable=protected-access
+
+
+def _make_stub(name: str, methods: Tuple[str, ...]) -> Type[ZabbixAPIObject]:
+    namespace: Dict[str, Any] = {"__slots__": ()}
+    for method in methods:
+        namespace[method] = _StubMethod(method)
+    return type(f"ZabbixAPI{name.capitalize()}", (ZabbixAPIObject,), namespace)
+
+
+_STUBS: Dict[str, Type[ZabbixAPIObject]] = {
+    name: _make_stub(name, methods) for name, methods in OBJECTS.items()
+}
@@ -36,12 +36,25 @@ setup(
     install_requires=[
         "requests>=1.0",
         "packaging",
+        "urllib3>=1.26",
     ],
     extras_require={
+        "async": [
+            "httpx[http2]",
+        ],
+        "stream": [
+            "ijson>=3.1",
+        ],
+        "orjson": [
+            "orjson",
+        ],
         "dev": [
             "black",
+            "httpx",
+            "ijson>=3.1",
             "isort",
             "mypy",
+            "orjson",
             "pylint",
             "pytest-cov",
             "pytest-xdist",
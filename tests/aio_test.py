@@ -0,0 +1,116 @@
+# pylint: disable=wrong-import-order
+
+import asyncio
+import json
+
+import pytest
+
+from pyzabbix import ZabbixAPI, ZabbixAPIException
+
+httpx = pytest.importorskip("httpx")
+
+# pylint: disable=wrong-import-position
+from pyzabbix.aio import AsyncZabbixAPI  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def clear_version_cache():
+    ZabbixAPI.clear_version_cache()
+
+
+def _zabbix_client_factory(requests, responses):
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=responses.pop(0))
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_login():
+    requests = []
+    client = _zabbix_client_factory(
+        requests,
+        [
+            {"jsonrpc": "2.0", "result": "6.0.0", "id": 0},
+            {"jsonrpc": "2.0", "result": "0424bd59b807674191e7d77572075f33", "id": 1},
+        ],
+    )
+
+    async def main():
+        zapi = AsyncZabbixAPI("http://example.com", client=client)
+        await zapi.login("mylogin", "mypass")
+        return zapi
+
+    zapi = asyncio.run(main())
+
+    assert json.loads(requests[-1].content) == {
+        "jsonrpc": "2.0",
+        "method": "user.login",
+        "params": {"username": "mylogin", "password": "mypass"},
+        "id": 1,
+    }
+    assert requests[-1].headers["Content-Type"] == "application/json-rpc"
+    assert zapi.auth == "0424bd59b807674191e7d77572075f33"
+
+
+def test_gather():
+    requests = []
+    client = _zabbix_client_factory(
+        requests,
+        [
+            {"jsonrpc": "2.0", "result": [{"hostid": 1234}], "id": 0},
+            {"jsonrpc": "2.0", "result": [{"itemid": 5678}], "id": 1},
+        ],
+    )
+
+    async def main():
+        zapi = AsyncZabbixAPI("http://example.com", client=client)
+        zapi.auth = "some_auth_key"
+        return await asyncio.gather(
+            zapi.host.get(),
+            zapi["item"]["get"](hostids=1234),
+        )
+
+    assert asyncio.run(main()) == [[{"hostid": 1234}], [{"itemid": 5678}]]
+    assert [json.loads(request.content)["id"] for request in requests] == [0, 1]
+
+
+def test_error_response():
+    client = _zabbix_client_factory(
+        [],
+        [
+            {
+                "jsonrpc": "2.0",
+                "error": {"code": -32602, "message": "Invalid params."},
+                "id": 0,
+            }
+        ],
+    )
+
+    async def main():
+        zapi = AsyncZabbixAPI("http://example.com", client=client)
+        await zapi.host.get()
+
+    with pytest.raises(ZabbixAPIException, match="Error -32602: Invalid params."):
+        asyncio.run(main())
+
+
+def test_timeout():
+    requests = []
+    client = _zabbix_client_factory(
+        requests,
+        [
+            {"jsonrpc": "2.0", "result": [], "id": 0},
+            {"jsonrpc": "2.0", "result": [], "id": 1},
+        ],
+    )
+
+    async def main():
+        await AsyncZabbixAPI("http://example.com", client=client).host.get()
+        await AsyncZabbixAPI("http://example.com", client=client, timeout=3).host.get()
+
+    asyncio.run(main())
+
+    # The timeout of the provided client is kept unless one is given
+    assert requests[0].extensions["timeout"]["read"] == 5.0
+    assert requests[1].extensions["timeout"]["read"] == 3
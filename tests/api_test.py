@@ -1,7 +1,16 @@
+# pylint: disable=wrong-import-order
+
 import pytest
 from packaging.version import Version
+from requests import Session
 
-from pyzabbix import ZabbixAPI, ZabbixAPIException
+from pyzabbix import (
+    ZabbixAPI,
+    ZabbixAPIException,
+    ZabbixAPIMethod,
+    ZabbixAPIObjectClass,
+)
+from pyzabbix.api import _normalize_url
 
 
 @pytest.mark.parametrize(
@@ -17,6 +26,32 @@ def test_server_url_correction(server, expected):
     assert ZabbixAPI(server).url == expected
 
 
+def test_server_url_correction_is_cached():
+    _normalize_url.cache_clear()
+    ZabbixAPI("http://example.com")
+    ZabbixAPI("http://example.com")
+    assert _normalize_url.cache_info().hits == 1
+
+
+@pytest.fixture(autouse=True)
+def clear_version_cache():
+    ZabbixAPI.clear_version_cache()
+
+
+def test_session_adapter():
+    zapi = ZabbixAPI("http://example.com", pool_maxsize=8)
+    adapter = zapi.session.get_adapter("https://example.com")
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 8
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.read == 0
+    assert adapter.max_retries.status_forcelist == (503,)
+    assert not adapter.max_retries.respect_retry_after_header
+
+    session = Session()
+    zapi = ZabbixAPI("http://example.com", session=session)
+    assert session.get_adapter("https://example.com").max_retries.total == 0
+
+
 def _zabbix_requests_mock_factory(requests_mock, *args, **kwargs):
     requests_mock.post(
         "http://example.com/api_jsonrpc.php",
@@ -106,6 +141,163 @@ def test_login_with_version_detect(requests_mock, version):
         assert zapi.auth == "0424bd59b807674191e7d77572075f33"
 
 
+def test_login_with_token_cache(requests_mock, tmp_path):
+    _zabbix_requests_mock_factory(
+        requests_mock,
+        [
+            {"json": {"jsonrpc": "2.0", "result": "some_auth_key", "id": 0}},
+            {"json": {"jsonrpc": "2.0", "result": {"userid": "1"}, "id": 0}},
+        ],
+    )
+
+    zapi = ZabbixAPI(
+        "http://example.com", detect_version=False, token_cache_path=str(tmp_path)
+    )
+    zapi.login("mylogin", "mypass")
+    assert requests_mock.last_request.json()["method"] == "user.login"
+
+    (token_file,) = tmp_path.iterdir()
+    assert token_file.read_text() == "some_auth_key"
+    assert token_file.stat().st_mode & 0o777 == 0o600
+
+    zapi = ZabbixAPI(
+        "http://example.com", detect_version=False, token_cache_path=str(tmp_path)
+    )
+    zapi.login("mylogin", "mypass")
+    assert requests_mock.last_request.json() == {
+        "jsonrpc": "2.0",
+        "method": "user.checkAuthentication",
+        "params": {"sessionid": "some_auth_key"},
+        "id": 0,
+    }
+    assert zapi.auth == "some_auth_key"
+
+
+def test_is_authenticated_is_cached(requests_mock):
+    _zabbix_requests_mock_factory(
+        requests_mock,
+        [
+            {"json": {"jsonrpc": "2.0", "result": {"userid": "1"}, "id": 0}},
+            {
+                "json": {
+                    "jsonrpc": "2.0",
+                    "error": {
+                        "code": -32500,
+                        "message": "Application error.",
+                        "data": "Session terminated, re-login, please.",
+                    },
+                    "id": 1,
+                }
+            },
+        ],
+    )
+
+    zapi = ZabbixAPI("http://example.com", detect_version=False)
+    zapi.auth = "some_auth_key"
+
+    assert zapi.is_authenticated
+    assert zapi.is_authenticated
+    assert requests_mock.call_count == 1
+
+    with pytest.raises(ZabbixAPIException, match="Session terminated"):
+        zapi.host.get()
+
+    assert not zapi.is_authenticated
+    assert requests_mock.call_count == 3
+
+
+def test_is_authenticated_after_boot(requests_mock, monkeypatch):
+    _zabbix_requests_mock_factory(
+        requests_mock,
+        json={
+            "jsonrpc": "2.0",
+            "error": {"code": -32500, "message": "Application error."},
+            "id": 0,
+        },
+    )
+    # The monotonic clock may start at the boot of the host
+    monkeypatch.setattr("time.monotonic", lambda: 30.0)
+
+    zapi = ZabbixAPI("http://example.com", detect_version=False)
+    assert not zapi.is_authenticated
+    assert requests_mock.call_count == 1
+
+
+def test_is_authenticated_new_token(requests_mock):
+    _zabbix_requests_mock_factory(
+        requests_mock,
+        json={"jsonrpc": "2.0", "result": {"userid": "1"}, "id": 0},
+    )
+
+    zapi = ZabbixAPI("http://example.com", detect_version=False)
+    zapi.auth = "some_auth_key"
+    assert zapi.is_authenticated
+    assert zapi.is_authenticated
+    assert requests_mock.call_count == 1
+
+    zapi.auth = "other_auth_key"
+    assert zapi.is_authenticated
+    assert requests_mock.call_count == 2
+    assert requests_mock.last_request.json()["params"] == {
+        "sessionid": "other_auth_key"
+    }
+
+
+def test_exit_with_expired_session(requests_mock):
+    _zabbix_requests_mock_factory(
+        requests_mock,
+        [
+            {"json": {"jsonrpc": "2.0", "result": {"userid": "1"}, "id": 0}},
+            {
+                "json": {
+                    "jsonrpc": "2.0",
+                    "error": {
+                        "code": -32500,
+                        "message": "Application error.",
+                        "data": "Session terminated, re-login, please.",
+                    },
+                    "id": 1,
+                }
+            },
+        ],
+    )
+
+    with ZabbixAPI("http://example.com", detect_version=False) as zapi:
+        zapi.auth = "some_auth_key"
+        assert zapi.is_authenticated
+
+    # The session is checked again and the logout is skipped
+    assert requests_mock.call_count == 2
+    assert requests_mock.last_request.json()["method"] == "user.checkAuthentication"
+
+
+def test_auth_header_is_not_shared(requests_mock):
+    _zabbix_requests_mock_factory(
+        requests_mock,
+        json={"jsonrpc": "2.0", "result": [], "id": 0},
+    )
+
+    session = Session()
+    zapi_a = ZabbixAPI("http://example.com", session=session, detect_version=False)
+    zapi_a.version = Version("7.0.0")
+    zapi_a.auth = "some_auth_key"
+    zapi_b = ZabbixAPI("http://example.com", session=session, detect_version=False)
+
+    zapi_a.host.get()
+    assert requests_mock.last_request.headers["Authorization"] == "Bearer some_auth_key"
+    assert "Authorization" not in session.headers
+
+    zapi_b.host.get()
+    assert "Authorization" not in requests_mock.last_request.headers
+
+    # The header follows changes of the auth token
+    zapi_a.auth = "other_auth_key"
+    zapi_a.host.get()
+    assert (
+        requests_mock.last_request.headers["Authorization"] == "Bearer other_auth_key"
+    )
+
+
 def test_attr_syntax_kwargs(requests_mock):
     _zabbix_requests_mock_factory(
         requests_mock,
@@ -133,6 +325,49 @@ def test_attr_syntax_kwargs(requests_mock):
     assert result == [{"hostid": 1234}]
 
 
+def test_attr_syntax_kwargs_without_orjson(requests_mock, monkeypatch):
+    monkeypatch.setattr("pyzabbix.api.orjson", None)
+    _zabbix_requests_mock_factory(
+        requests_mock,
+        json={
+            "jsonrpc": "2.0",
+            "result": [{"hostid": 1234}],
+            "id": 0,
+        },
+    )
+
+    zapi = ZabbixAPI("http://example.com", detect_version=False)
+    result = zapi.host.get(hostids=5)
+
+    assert requests_mock.last_request.json() == {
+        "jsonrpc": "2.0",
+        "method": "host.get",
+        "params": {"hostids": 5},
+        "id": 0,
+    }
+    assert result == [{"hostid": 1234}]
+
+
+def test_request_id(requests_mock):
+    _zabbix_requests_mock_factory(
+        requests_mock,
+        json={"jsonrpc": "2.0", "result": [], "id": 0},
+    )
+
+    zapi = ZabbixAPI("http://example.com", detect_version=False)
+    assert zapi.id == 0
+
+    zapi.host.get()
+    zapi.host.get()
+    assert requests_mock.last_request.json()["id"] == 1
+    assert zapi.id == 2
+
+    zapi.id = 10
+    zapi.host.get()
+    assert requests_mock.last_request.json()["id"] == 10
+    assert zapi.id == 11
+
+
 def test_attr_syntax_args(requests_mock):
     _zabbix_requests_mock_factory(
         requests_mock,
@@ -160,6 +395,137 @@ def test_attr_syntax_args(requests_mock):
     assert result == {"itemids": ["22982", "22986"]}
 
 
+def test_attr_syntax_stream(requests_mock):
+    pytest.importorskip("ijson")
+    _zabbix_requests_mock_factory(
+        requests_mock,
+        json={
+            "jsonrpc": "2.0",
+            "result": [
+                {"itemid": "1", "clock": "1700000000", "value": "1.5"},
+                {"itemid": "1", "clock": "1700000060", "tags": [{"tag": "a"}]},
+            ],
+            "id": 0,
+        },
+    )
+
+    zapi = ZabbixAPI("http://example.com", detect_version=False)
+    zapi.auth = "some_auth_key"
+    result = zapi.history.get(itemids=["1"], stream=True)
+
+    assert not requests_mock.called
+    assert list(result) == [
+        {"itemid": "1", "clock": "1700000000", "value": "1.5"},
+        {"itemid": "1", "clock": "1700000060", "tags": [{"tag": "a"}]},
+    ]
+    assert requests_mock.last_request.json() == {
+        "jsonrpc": "2.0",
+        "method": "history.get",
+        "params": {"itemids": ["1"]},
+        "auth": "some_auth_key",
+        "id": 0,
+    }
+
+
+@pytest.mark.parametrize(
+    "result",
+    [
+        ("42"),
+        ({"hostids": ["1234"]}),
+    ],
+)
+def test_attr_syntax_stream_non_array_result(requests_mock, result):
+    pytest.importorskip("ijson")
+    _zabbix_requests_mock_factory(
+        requests_mock,
+        json={"jsonrpc": "2.0", "result": result, "id": 0},
+    )
+
+    zapi = ZabbixAPI("http://example.com", detect_version=False)
+    assert list(zapi.history.get(countOutput=True, stream=True)) == [result]
+
+
+def test_attr_syntax_stream_float(requests_mock):
+    pytest.importorskip("ijson")
+    _zabbix_requests_mock_factory(
+        requests_mock,
+        json={"jsonrpc": "2.0", "result": [{"value": 1.5}], "id": 0},
+    )
+
+    zapi = ZabbixAPI("http://example.com", detect_version=False)
+    result = list(zapi.history.get(stream=True))
+    assert result == [{"value": 1.5}]
+    assert isinstance(result[0]["value"], float)
+
+
+def test_attr_syntax_stream_error_response(requests_mock):
+    pytest.importorskip("ijson")
+    _zabbix_requests_mock_factory(
+        requests_mock,
+        json={
+            "jsonrpc": "2.0",
+            "error": {"code": -32602, "message": "Invalid params."},
+            "id": 0,
+        },
+    )
+
+    zapi = ZabbixAPI("http://example.com", detect_version=False)
+    with pytest.raises(ZabbixAPIException, match="Error -32602: Invalid params."):
+        list(zapi.history.get(stream=True))
+
+
+def test_attr_syntax_subclass_members():
+    class MyZabbixAPI(ZabbixAPI):
+        def host(self):
+            return "my host"
+
+    zapi = MyZabbixAPI("http://example.com", detect_version=False)
+    assert zapi.host() == "my host"
+    assert zapi["host"].get is not None
+    assert zapi.host() == "my host"
+
+
+def test_attr_syntax_keeps_attributes():
+    zapi = ZabbixAPI("http://example.com", detect_version=False)
+    zapi.auth = "some_auth_key"
+
+    assert zapi["auth"] is not zapi.auth
+    assert zapi["url"] is not zapi.url
+    assert zapi.auth == "some_auth_key"
+    assert zapi.url == "http://example.com/api_jsonrpc.php"
+
+
+def test_attr_syntax_is_memoized():
+    zapi = ZabbixAPI("http://example.com")
+
+    # Dynamic (mfa) and stubbed (host) objects behave the same
+    for name in ("mfa", "host"):
+        obj = getattr(zapi, name)
+        assert obj is zapi[name]
+        assert obj.get is zapi[name]["get"]
+        assert obj.get is not obj.create
+        assert isinstance(obj.get, ZabbixAPIMethod)
+
+
+def test_attr_syntax_stubs(requests_mock):
+    _zabbix_requests_mock_factory(
+        requests_mock,
+        json={"jsonrpc": "2.0", "result": {"hostids": ["1234"]}, "id": 0},
+    )
+
+    zapi = ZabbixAPI("http://example.com", detect_version=False)
+    assert "host" not in vars(zapi)
+    assert zapi.host is zapi["host"]
+    assert vars(zapi)["host"] is zapi.host
+
+    assert zapi.host.delete("1234") == {"hostids": ["1234"]}
+    assert requests_mock.last_request.json()["method"] == "host.delete"
+
+    # Methods missing from the stub are still resolved dynamically
+    assert zapi.user.unblock("1") == {"hostids": ["1234"]}
+    assert requests_mock.last_request.json()["method"] == "user.unblock"
+
+
 def test_attr_syntax_args_and_kwargs_raises():
     with pytest.raises(
         TypeError,
@@ -194,6 +560,27 @@ def test_detecting_version(requests_mock, version):
     assert zapi.api_version() == version
 
 
+def test_detecting_version_is_cached(requests_mock):
+    _zabbix_requests_mock_factory(
+        requests_mock,
+        [
+            {"json": {"jsonrpc": "2.0", "result": "6.0.0", "id": 0}},
+            {"json": {"jsonrpc": "2.0", "result": "some_auth_key", "id": 1}},
+            {"json": {"jsonrpc": "2.0", "result": "other_auth_key", "id": 0}},
+        ],
+    )
+
+    ZabbixAPI("http://example.com").login("mylogin", "mypass")
+
+    zapi = ZabbixAPI("http://example.com")
+    zapi.login("mylogin", "mypass")
+
+    assert requests_mock.call_count == 3
+    assert requests_mock.last_request.json()["method"] == "user.login"
+    assert zapi.version == Version("6.0.0")
+    assert zapi.auth == "other_auth_key"
+
+
 @pytest.mark.parametrize(
     "data",
     [
@@ -225,6 +612,17 @@ def test_error_response(requests_mock, data):
         zapi.host.get()
 
 
+def test_invalid_json_response(requests_mock):
+    _zabbix_requests_mock_factory(
+        requests_mock,
+        text="<html>Not Found</html>",
+    )
+
+    with pytest.raises(ZabbixAPIException, match="Unable to parse json"):
+        zapi = ZabbixAPI("http://example.com")
+        zapi.host.get()
+
+
 def test_empty_response(requests_mock):
     _zabbix_requests_mock_factory(
         requests_mock,
@@ -283,3 +681,204 @@ def test_do_request(requests_mock, version):
 
     assert found.json() == expect_json
     assert found.headers.items() >= expect_headers.items()
+
+
+def test_do_batch(requests_mock):
+    _zabbix_requests_mock_factory(
+        requests_mock,
+        json=[
+            {"jsonrpc": "2.0", "result": [{"itemid": 5678}], "id": 1},
+            {"jsonrpc": "2.0", "result": [{"hostid": 1234}], "id": 0},
+        ],
+    )
+
+    zapi = ZabbixAPI("http://example.com", detect_version=False)
+    zapi.auth = "some_auth_key"
+    responses = zapi.do_batch([("host.get", {}), ("item.get", {"hostids": 1234})])
+
+    # Check request
+    assert requests_mock.last_request.json() == [
+        {
+            "jsonrpc": "2.0",
+            "method": "host.get",
+            "params": {},
+            "auth": "some_auth_key",
+            "id": 0,
+        },
+        {
+            "jsonrpc": "2.0",
+            "method": "item.get",
+            "params": {"hostids": 1234},
+            "auth": "some_auth_key",
+            "id": 1,
+        },
+    ]
+
+    # Check responses are ordered by id
+    assert [response["result"] for response in responses] == [
+        [{"hostid": 1234}],
+        [{"itemid": 5678}],
+    ]
+
+
+def test_do_batch_invalid_request(requests_mock):
+    _zabbix_requests_mock_factory(
+        requests_mock,
+        json=[
+            {"jsonrpc": "2.0", "result": [{"hostid": 1234}], "id": 0},
+            {
+                "jsonrpc": "2.0",
+                "error": {
+                    "code": -32600,
+                    "message": "Invalid request.",
+                    "data": 'Invalid parameter "/": unexpected parameter "x".',
+                },
+                "id": None,
+            },
+        ],
+    )
+
+    zapi = ZabbixAPI("http://example.com", detect_version=False)
+    with pytest.raises(ZabbixAPIException, match="Error -32600: Invalid request."):
+        zapi.do_batch([("host.get", {}), ("item.get", {})])
+
+
+def test_batch(requests_mock):
+    _zabbix_requests_mock_factory(
+        requests_mock,
+        json=[
+            {"jsonrpc": "2.0", "result": [{"hostid": 1234}], "id": 0},
+            {
+                "jsonrpc": "2.0",
+                "error": {"code": -32602, "message": "Invalid params."},
+                "id": 1,
+            },
+        ],
+    )
+
+    zapi = ZabbixAPI("http://example.com", detect_version=False)
+    with zapi.batch() as batch:
+        hosts = batch.host.get()
+        items = batch["item"]["get"](hostids=1234)
+        assert not hosts.done()
+
+    assert requests_mock.call_count == 1
+    assert hosts.result() == [{"hostid": 1234}]
+    with pytest.raises(ZabbixAPIException, match="Error -32602: Invalid params."):
+        items.result()
+
+
+def test_multicall(requests_mock):
+    def callback(request, _context):
+        payload = request.json()
+        return {
+            "jsonrpc": "2.0",
+            "result": [{"hostid": payload["params"]["hostids"]}],
+            "id": payload["id"],
+        }
+
+    _zabbix_requests_mock_factory(requests_mock, json=callback)
+
+    zapi = ZabbixAPI("http://example.com", detect_version=False, pool_maxsize=4)
+    results = zapi.multicall(
+        "host.get",
+        ({"hostids": hostid} for hostid in range(20)),
+        max_workers=4,
+    )
+
+    assert results == [[{"hostid": hostid}] for hostid in range(20)]
+    assert requests_mock.call_count == 20
+    assert (
+        len({request.json()["id"] for request in requests_mock.request_history}) == 20
+    )
+
+
+def test_multicall_max_workers(requests_mock):
+    _zabbix_requests_mock_factory(
+        requests_mock,
+        json={"jsonrpc": "2.0", "result": [], "id": 0},
+    )
+
+    zapi = ZabbixAPI("http://example.com", detect_version=False, pool_maxsize=2)
+
+    # Extra workers would open connections that are not reused
+    with pytest.raises(ValueError, match="larger than pool_maxsize"):
+        zapi.multicall("host.get", [{}], max_workers=4)
+
+    # The default number of workers fits in the pool
+    assert zapi.multicall("host.get", [{}, {}, {}]) == [[], [], []]
+
+
+def test_pipeline(requests_mock):
+    _zabbix_requests_mock_factory(
+        requests_mock,
+        [
+            {
+                "json": [
+                    {
+                        "jsonrpc": "2.0",
+                        "result": [{"hostid": "1"}, {"hostid": "2"}],
+                        "id": 0,
+                    },
+                ]
+            },
+            {
+                "json": [
+                    {"jsonrpc": "2.0", "result": [{"itemid": "10"}], "id": 1},
+                    {"jsonrpc": "2.0", "result": [{"itemid": "20"}], "id": 2},
+                ]
+            },
+        ],
+    )
+
+    zapi = ZabbixAPI("http://example.com", detect_version=False)
+    pipeline = zapi.pipeline()
+    hosts = pipeline.call(
+        "host.get",
+        {"output": ["hostid"]},
+        extract=lambda hosts: [host["hostid"] for host in hosts],
+    )
+    pipeline.call(
+        "item.get",
+        lambda hostid: {"hostids": hostid},
+        after=hosts,
+        fan_out=True,
+    )
+
+    assert pipeline.execute() == [
+        ["1", "2"],
+        [[{"itemid": "10"}], [{"itemid": "20"}]],
+    ]
+    assert requests_mock.call_count == 2
+    assert requests_mock.last_request.json() == [
+        {"jsonrpc": "2.0", "method": "item.get", "params": {"hostids": "1"}, "id": 1},
+        {"jsonrpc": "2.0", "method": "item.get", "params": {"hostids": "2"}, "id": 2},
+    ]
+
+
+def test_object_class_deprecation_warns_once(monkeypatch):
+    monkeypatch.setattr(ZabbixAPIObjectClass, "_warned", False)
+    zapi = ZabbixAPI("http://example.com")
+
+    with pytest.warns(DeprecationWarning, match="has been renamed") as record:
+        ZabbixAPIObjectClass("host", zapi)
+        ZabbixAPIObjectClass("item", zapi)
+
+    assert len(record) == 1
+
+
+def test_confimport_deprecation_warns_once(requests_mock, monkeypatch):
+    _zabbix_requests_mock_factory(
+        requests_mock,
+        json={"jsonrpc": "2.0", "result": True, "id": 0},
+    )
+    monkeypatch.setattr("pyzabbix.api._CONFIMPORT_WARNED", False)
+    zapi = ZabbixAPI("http://example.com", detect_version=False)
+
+    with pytest.warns(DeprecationWarning, match="confimport") as record:
+        assert zapi.confimport("json", "{}", {})
+        assert zapi.confimport("json", "{}", {})
+
+    assert len(record) == 1
+    assert requests_mock.call_count == 2
+    assert requests_mock.last_request.json()["method"] == "configuration.import"